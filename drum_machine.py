@@ -80,10 +80,16 @@ class DrumMachineGUI(QtWidgets.QMainWindow):
 
             self.grid_layout.addWidget(frame, 0, block // 4 + 1, self.rows, 1)  # Place in grid, span vertically
 
+        # Column-major button lists so the beat handler can walk a step
+        # without per-button dict lookups
+        self.step_buttons = [[self.buttons[(i, j)] for i in range(self.rows)]
+                             for j in range(self.cols)]
 
         # Sample playback using pygame mixer
         pygame.mixer.init()
         self.samples = self.load_samples()
+        # Mono float arrays for the waveform mix, converted once per sample
+        self.sample_arrays = {i: self.sample_to_mono(s) for i, s in self.samples.items()}
 
         # Control panel
         self.control_panel = QtWidgets.QHBoxLayout()
@@ -127,6 +133,9 @@ class DrumMachineGUI(QtWidgets.QMainWindow):
         self.waveform_widget.setLabel('left', 'Amplitude')
         self.waveform_widget.setLabel('bottom', 'Time')
 
+        # Reused mix buffer for the beat handler (1 second at 44.1kHz)
+        self.mix_buffer = np.zeros(44100, dtype=np.float32)
+
     def get_button_style(self, is_pushed):
         color = self.pushed_color if is_pushed else self.unpushed_color
         return f"background-color: {color.name()}; border: 1px solid black;"
@@ -138,14 +147,28 @@ class DrumMachineGUI(QtWidgets.QMainWindow):
     def load_samples(self):
         samples = {}
         sample_folder = "samples"  # Make sure this folder exists and contains your sample files
+        # One directory listing instead of a stat call per sample slot
+        try:
+            available = set(os.listdir(sample_folder))
+        except OSError:
+            available = set()
         for i in range(self.rows):
-            sample_path = os.path.join(sample_folder, f"sample{i}.wav")
-            if os.path.exists(sample_path):
+            sample_name = f"sample{i}.wav"
+            sample_path = os.path.join(sample_folder, sample_name)
+            if sample_name in available:
                 samples[i] = pygame.mixer.Sound(sample_path)
             else:
                 print(f"Warning: Sample file {sample_path} not found.")
         return samples
 
+    def sample_to_mono(self, sound):
+        sample_array = pygame.sndarray.array(sound)
+        if sample_array.ndim == 1:
+            # Already mono; just convert the dtype
+            return sample_array.astype(np.float32)
+        # Average any channel layout down to mono, converting in the same pass
+        return sample_array.mean(axis=1, dtype=np.float32)
+
     def toggle_playback(self):
         if self.playing:
             self.timer.stop()
@@ -161,36 +184,39 @@ class DrumMachineGUI(QtWidgets.QMainWindow):
             self.timer.start(60000 // int(self.bpm_display.text()) // 4)
 
     def update_beat(self):
-        mix_buffer = np.zeros(44100)  # Assuming 1 second of audio at 44.1kHz
+        # Zero the preallocated buffer in place rather than allocating a
+        # fresh one-second array on every 16th note
+        mix_buffer = self.mix_buffer
+        mix_buffer.fill(0)
 
-        for i in range(self.rows):
+        for i, button in enumerate(self.step_buttons[self.current_step]):
             # Check if a button at the current step is pushed
-            if self.buttons[(i, self.current_step)].isChecked():
+            if button.isChecked():
                 if i in self.samples:
                     self.samples[i].play()
-                    sample_array = pygame.sndarray.array(self.samples[i])
-
-                    # Convert stereo to mono if needed
-                    if sample_array.ndim == 2 and sample_array.shape[1] == 2:
-                        sample_array = sample_array.sum(axis=1) / 2  # Average the left and right channels
+                    sample_array = self.sample_arrays[i]
 
                     # Add the sample to the mix buffer
                     mix_buffer[:len(sample_array)] += sample_array
 
+        # Normalize the mixed waveform for display: a single min/max reduce
+        # (no abs temporary) followed by one in-place scale
+        peak = max(-mix_buffer.min(), mix_buffer.max())
+        if peak > 0:
+            mix_buffer *= 1.0 / peak
+
         # Update waveform display
         self.waveform_plot.setData(mix_buffer)
 
         # Move to the next step
+        previous_step = self.current_step
         self.current_step = (self.current_step + 1) % self.cols
 
-        # Highlight current step
-        for i in range(self.rows):
-            for j in range(self.cols):
-                button = self.buttons[(i, j)]
-                if j == self.current_step:
-                    button.setStyleSheet(f"{self.get_button_style(button.isChecked())} border: 2px solid red;")
-                else:
-                    button.setStyleSheet(self.get_button_style(button.isChecked()))
+        # Restyle only the column the playhead left and the one it entered
+        for button in self.step_buttons[previous_step]:
+            button.setStyleSheet(self.get_button_style(button.isChecked()))
+        for button in self.step_buttons[self.current_step]:
+            button.setStyleSheet(f"{self.get_button_style(button.isChecked())} border: 2px solid red;")
 
 
     def clear_grid(self):
@@ -244,6 +270,7 @@ class DrumMachineGUI(QtWidgets.QMainWindow):
         file_path, _ = file_dialog.getOpenFileName(self, "Load Sample", "", "Audio Files (*.wav)")
         if file_path:
             self.samples[track] = pygame.mixer.Sound(file_path)
+            self.sample_arrays[track] = self.sample_to_mono(self.samples[track])
             self.sample_names[track] = os.path.basename(file_path)
             self.grid_layout.itemAtPosition(track, 0).widget().setText(self.sample_names[track])
 
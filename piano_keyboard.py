@@ -8,6 +8,9 @@ import os
 import time
 import json
 
+# pyo LFO waveform types, resolved once at import instead of per keypress
+LFO_WAVEFORM_TYPES = {"Square": 2, "Sawtooth": 1, "Triangle": 3, "PWM": 5}
+
 class PianoKey(QPushButton):
     def __init__(self, note, is_black=False, parent=None):
         super().__init__(parent)
@@ -160,10 +163,15 @@ class PianoKeyboardWindow(QMainWindow):
             ("Release", 1, 2000, 500, self.update_adsr),
         ]
 
+        # Registry of slider controls so preset code can iterate them
+        # directly instead of scanning dir(self) for matching names
+        self.sliders = {}
         for label, min_val, max_val, default_val, connect_func in sliders:
             slider_info = self.create_slider(label, min_val, max_val, default_val, connect_func)
             controls_layout.addLayout(slider_info['layout'])
-            setattr(self, f"{label.lower().replace(' ', '_')}_slider", slider_info)
+            control_name = f"{label.lower().replace(' ', '_')}_slider"
+            setattr(self, control_name, slider_info)
+            self.sliders[control_name] = slider_info
 
         # Pitch bend wheels
         pitch_bend_layout = QVBoxLayout()
@@ -251,13 +259,11 @@ class PianoKeyboardWindow(QMainWindow):
 
     def get_current_settings(self):
         settings = {}
-        for control_name in dir(self):
-            if control_name.endswith('_slider'):
-                slider_info = getattr(self, control_name)
-                settings[control_name] = {
-                    'value': slider_info['slider'].value(),
-                    'enabled': slider_info['checkbox'].isChecked()
-                }
+        for control_name, slider_info in self.sliders.items():
+            settings[control_name] = {
+                'value': slider_info['slider'].value(),
+                'enabled': slider_info['checkbox'].isChecked()
+            }
         settings['waveform'] = self.current_waveform
         settings['sample'] = getattr(self, 'current_sample', None)
         settings['indefinite_sustain'] = self.sustain_indefinite_checkbox.isChecked()
@@ -267,8 +273,8 @@ class PianoKeyboardWindow(QMainWindow):
 
     def apply_preset(self, preset):
         for control_name, control_settings in preset.items():
-            if control_name.endswith('_slider'):
-                slider_info = getattr(self, control_name)
+            if control_name in self.sliders:
+                slider_info = self.sliders[control_name]
                 slider_info['slider'].setValue(control_settings['value'])
                 slider_info['checkbox'].setChecked(control_settings['enabled'])
             elif control_name == 'waveform':
@@ -342,14 +348,8 @@ class PianoKeyboardWindow(QMainWindow):
         if self.current_sound_source == "Waveform":
             if self.current_waveform == "Sine":
                 synth = Sine(freq=freq, mul=0.8).mix(2)
-            elif self.current_waveform == "Square":
-                synth = LFO(freq=freq, type=2, mul=0.8).mix(2)
-            elif self.current_waveform == "Sawtooth":
-                synth = LFO(freq=freq, type=1, mul=0.8).mix(2)
-            elif self.current_waveform == "Triangle":
-                synth = LFO(freq=freq, type=3, mul=0.8).mix(2)
-            elif self.current_waveform == "PWM":
-                synth = LFO(freq=freq, type=5, mul=0.8).mix(2)
+            else:
+                synth = LFO(freq=freq, type=LFO_WAVEFORM_TYPES[self.current_waveform], mul=0.8).mix(2)
         elif self.current_sound_source == "Sample" and self.current_sample in self.samples:
             synth = Osc(table=self.samples[self.current_sample], freq=freq, mul=0.8).mix(2)
         else:
@@ -2,7 +2,7 @@ import sys
 import numpy as np
 import pyaudio
 import wave
-import io
+from collections import deque
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QSlider, QFileDialog)
 from PyQt5.QtCore import Qt, QTimer
@@ -23,10 +23,22 @@ class RecordingStudioGUI(QMainWindow):
         self.FORMAT = pyaudio.paInt16
         self.CHANNELS = 2
         self.RATE = 44100
+        self.MAX_PLOT_POINTS = 100000  # Display budget; caps redraw cost
         self.p = pyaudio.PyAudio()
         self.frames = []
         self.is_recording = False
         self.stream = None
+        self.playback_stream = None
+
+        # Chunks handed from the audio callback to the GUI thread; deque
+        # append/popleft are atomic, so no lock is needed for this
+        # single-producer single-consumer handoff
+        self.pending_frames = deque()
+
+        # Incrementally built waveform for the display (grows by doubling)
+        self.waveform_data = np.zeros(0, dtype=np.int16)
+        self.waveform_length = 0
+        self.waveform_peak = 1
 
         # Recording controls
         self.record_button = QPushButton("Record")
@@ -62,11 +74,13 @@ class RecordingStudioGUI(QMainWindow):
         self.layout.addWidget(self.waveform_plot)
         self.waveform_plot.setLabel('left', 'Amplitude')
         self.waveform_plot.setLabel('bottom', 'Time')
+        # Ranges are set manually from incrementally tracked values, so
+        # pyqtgraph never has to rescan the full waveform to autoscale
+        self.waveform_plot.disableAutoRange()
 
-        # Timer for updating the waveform
+        # Timer for updating the waveform (only runs while recording)
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_waveform)
-        self.update_timer.start(100)  # Update every 100 ms
 
     def toggle_recording(self):
         if not self.is_recording:
@@ -78,9 +92,13 @@ class RecordingStudioGUI(QMainWindow):
         self.is_recording = True
         self.record_button.setText("Stop Recording")
         self.frames = []
+        self.pending_frames = deque()
+        self.waveform_data = np.zeros(0, dtype=np.int16)
+        self.waveform_length = 0
+        self.waveform_peak = 1
 
         def callback(in_data, frame_count, time_info, status):
-            self.frames.append(in_data)
+            self.pending_frames.append(in_data)
             return (in_data, pyaudio.paContinue)
 
         self.stream = self.p.open(format=self.FORMAT,
@@ -91,6 +109,7 @@ class RecordingStudioGUI(QMainWindow):
                                   stream_callback=callback)
 
         self.stream.start_stream()
+        self.update_timer.start(100)  # Update every 100 ms
 
     def stop_recording(self):
         self.is_recording = False
@@ -101,6 +120,8 @@ class RecordingStudioGUI(QMainWindow):
             self.stream.close()
             self.stream = None
 
+        self.update_timer.stop()
+        self.update_waveform()  # Final refresh with the complete recording
         self.save_button.setEnabled(True)
 
     def save_recording(self):
@@ -113,42 +134,95 @@ class RecordingStudioGUI(QMainWindow):
             wf.setnchannels(self.CHANNELS)
             wf.setsampwidth(self.p.get_sample_size(self.FORMAT))
             wf.setframerate(self.RATE)
-            wf.writeframes(b''.join(self.frames))
+            # Stream chunk by chunk instead of joining the whole recording
+            # into one giant bytes object first. writeframesraw skips the
+            # per-call header patch (a seek + rewrite for every chunk);
+            # close() writes the final header once.
+            for frame in self.frames:
+                wf.writeframesraw(frame)
             wf.close()
 
     def play_recording(self):
         if not self.frames:
             return
 
+        # Feed the captured chunks straight back to the output stream; the
+        # format is already known, so there is no need to join the take
+        # into an in-memory WAV container and parse it back out
+        frames = self.frames
+        position = 0
+
         def callback(in_data, frame_count, time_info, status):
-            data = wf.readframes(frame_count)
+            nonlocal position
+            if position >= len(frames):
+                return (b'', pyaudio.paComplete)
+            data = frames[position]
+            position += 1
             return (data, pyaudio.paContinue)
 
-        wf = wave.open(io.BytesIO(b''.join(self.frames)), 'rb')
-        self.playback_stream = self.p.open(format=self.p.get_format_from_width(wf.getsampwidth()),
-                                           channels=wf.getnchannels(),
-                                           rate=wf.getframerate(),
+        self.playback_stream = self.p.open(format=self.FORMAT,
+                                           channels=self.CHANNELS,
+                                           rate=self.RATE,
                                            output=True,
+                                           frames_per_buffer=self.CHUNK,
                                            stream_callback=callback)
 
         self.playback_stream.start_stream()
 
     def stop_playback(self):
-        if hasattr(self, 'playback_stream') and self.playback_stream.is_active():
+        if self.playback_stream is not None and self.playback_stream.is_active():
             self.playback_stream.stop_stream()
             self.playback_stream.close()
 
     def set_volume(self, value):
-        if hasattr(self, 'playback_stream'):
+        if self.playback_stream is not None:
             volume = value / 100.0
             self.playback_stream.setVolume(volume)
 
     def update_waveform(self):
-        if self.frames:
-            waveform = np.frombuffer(b''.join(self.frames), dtype=np.int16)
-            time = np.arange(len(waveform)) / self.RATE
-            self.waveform_plot.clear()
-            self.waveform_plot.plot(time, waveform)
+        # Drain the chunks captured since the last update instead of
+        # re-joining and re-parsing the entire take every tick
+        new_frames = []
+        while self.pending_frames:
+            new_frames.append(self.pending_frames.popleft())
+        if not new_frames:
+            # Nothing new arrived; skip the redraw entirely
+            return
+
+        self.frames.extend(new_frames)
+        new_samples = np.frombuffer(b''.join(new_frames), dtype=np.int16)
+        needed = self.waveform_length + len(new_samples)
+        if needed > len(self.waveform_data):
+            grown = np.zeros(max(needed, 2 * len(self.waveform_data)), dtype=np.int16)
+            grown[:self.waveform_length] = self.waveform_data[:self.waveform_length]
+            self.waveform_data = grown
+        self.waveform_data[self.waveform_length:needed] = new_samples
+        self.waveform_length = needed
+
+        # Keep a running peak over just the new samples; a full-buffer
+        # scan is never needed to scale the display
+        new_peak = max(-int(new_samples.min()), int(new_samples.max()))
+        if new_peak > self.waveform_peak:
+            self.waveform_peak = new_peak
+            self.waveform_plot.setYRange(-self.waveform_peak, self.waveform_peak)
+
+        if not self.isVisible():
+            # Keep collecting audio, but skip paint work nobody can see
+            return
+
+        # The capture bytes are interleaved (L, R, L, R, ...); plot the left
+        # channel only so the trace walks one contiguous channel instead of
+        # zigzagging between channels at twice the point count
+        waveform = self.waveform_data[:self.waveform_length:self.CHANNELS]
+        # Decimate long takes so redraw cost stays bounded however much
+        # audio accumulates
+        stride = max(1, (len(waveform) + self.MAX_PLOT_POINTS - 1) // self.MAX_PLOT_POINTS)
+        if stride > 1:
+            waveform = waveform[::stride]
+        time = np.arange(len(waveform)) * (stride / self.RATE)
+        self.waveform_plot.setXRange(0, len(waveform) * stride / self.RATE)
+        self.waveform_plot.clear()
+        self.waveform_plot.plot(time, waveform)
 
     def closeEvent(self, event):
         self.stop_playback()
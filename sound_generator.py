@@ -7,6 +7,64 @@ from PyQt5.QtCore import Qt, QTimer, pyqtSignal
 from PyQt5.QtGui import QColor
 import pyqtgraph as pg
 
+# Single-cycle wavetables shared by all WaveTracks. The size is a power of
+# two so phase indices wrap with a mask instead of a modulo.
+WAVETABLE_SIZE = 4096
+
+# Oscillator phase is a 32.32 fixed-point table position held in a uint64;
+# the integer part indexes the wavetable and wrap-around is the natural
+# unsigned overflow, so no float modulo ever runs
+PHASE_FRAC_BITS = 32
+
+
+# Lowest oscillator pitch; matches the clamp in WaveTrack.set_frequency
+WAVETABLE_MIN_FREQ = 20.0
+
+
+def build_wavetable(wave_type, max_harmonics):
+    # One cycle built additively from the Fourier series, truncated at
+    # max_harmonics so every partial stays below Nyquist for the octave
+    # band the table serves — bandlimited square/saw/triangle instead of
+    # the aliasing ideal shapes
+    phase = np.arange(WAVETABLE_SIZE) * (2 * np.pi / WAVETABLE_SIZE)
+    if wave_type == 'sine':
+        table = np.sin(phase)
+    elif wave_type == 'square':
+        table = np.zeros(WAVETABLE_SIZE)
+        for k in range(1, max_harmonics + 1, 2):
+            table += np.sin(k * phase) / k
+        table *= 4 / np.pi
+    elif wave_type == 'sawtooth':
+        table = np.zeros(WAVETABLE_SIZE)
+        for k in range(1, max_harmonics + 1):
+            table += (-1) ** (k + 1) * np.sin(k * phase) / k
+        table *= 2 / np.pi
+    else:  # triangle
+        table = np.zeros(WAVETABLE_SIZE)
+        sign = 1.0
+        for k in range(1, max_harmonics + 1, 2):
+            table += sign * np.sin(k * phase) / (k * k)
+            sign = -sign
+        table *= 8 / np.pi ** 2
+    return table.astype(np.float32)
+
+
+def build_wavetable_stack(wave_type):
+    # One table per octave band: band b serves frequencies in
+    # [MIN_FREQ * 2**b, MIN_FREQ * 2**(b+1)) with only the harmonics that
+    # fit below Nyquist at the band's top frequency
+    tables = []
+    top = WAVETABLE_MIN_FREQ * 2
+    while top / 2 < 22050:
+        tables.append(build_wavetable(wave_type, max(1, int(22050 / top))))
+        top *= 2
+    return tables
+
+
+WAVETABLE_STACKS = {w: build_wavetable_stack(w)
+                    for w in ('sine', 'square', 'sawtooth', 'triangle')}
+
+
 class AutomatedDial(QDial):
     manualValueChanged = pyqtSignal(int)
     automatedValueChanged = pyqtSignal(int)
@@ -137,6 +195,12 @@ class EnhancedSoundGeneratorGUI(QMainWindow):
         self.p = pyaudio.PyAudio()
         self.stream = None
 
+        # Served whenever no tracks exist; allocated once
+        self.silence = np.zeros(self.frames_per_buffer, dtype=np.float32)
+        # Persistent accumulator for the multi-track mix; PyAudio copies
+        # the returned block before the next callback, so reuse is safe
+        self.mix_buffer = np.zeros(self.frames_per_buffer, dtype=np.float32)
+
         # Update timer
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_plot)
@@ -144,10 +208,12 @@ class EnhancedSoundGeneratorGUI(QMainWindow):
 
     def create_note_buttons(self):
         notes = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
+        self.note_buttons = {}
         for note in notes:
             button = QPushButton(note)
             button.clicked.connect(lambda checked, n=note: self.toggle_continuous_note_track(n))
             self.note_buttons_layout.addWidget(button)
+            self.note_buttons[note] = button
 
 
     def toggle_continuous_note_track(self, note):
@@ -162,7 +228,9 @@ class EnhancedSoundGeneratorGUI(QMainWindow):
             return
 
         track = ContinuousNoteTrack(note, 4, self.sample_rate)
-        self.tracks.append(track)
+        # Swap in a new list so the audio callback's snapshot never sees a
+        # list mutated mid-block
+        self.tracks = self.tracks + [track]
         self.continuous_note_tracks[note] = track
         self.add_track_controls(track)
 
@@ -170,11 +238,9 @@ class EnhancedSoundGeneratorGUI(QMainWindow):
         self.update_note_button_state(note, True)
 
     def update_note_button_state(self, note, is_active):
-        for i in range(self.note_buttons_layout.count()):
-            button = self.note_buttons_layout.itemAt(i).widget()
-            if button.text() == note:
-                button.setStyleSheet("background-color: green;" if is_active else "")
-                break
+        button = self.note_buttons.get(note)
+        if button is not None:
+            button.setStyleSheet("background-color: green;" if is_active else "")
 
 
     def add_track_controls(self, track):
@@ -185,7 +251,8 @@ class EnhancedSoundGeneratorGUI(QMainWindow):
         self.current_color_index = (self.current_color_index + 1) % len(self.track_colors)
 
     def remove_track(self, track, track_controls):
-        self.tracks.remove(track)
+        # Copy-on-write removal; see add_continuous_note_track
+        self.tracks = [t for t in self.tracks if t is not track]
         self.track_control_window.remove_track_controls(track_controls)
 
         # If it's a continuous note track, remove it from the continuous_note_tracks dictionary
@@ -221,7 +288,8 @@ class EnhancedSoundGeneratorGUI(QMainWindow):
         else:
             return
 
-        self.tracks.append(track)
+        # Copy-on-write append; see add_continuous_note_track
+        self.tracks = self.tracks + [track]
         track_controls = TrackControls(track, self.remove_track)
         self.track_control_window.add_track_controls(track_controls)
 
@@ -246,17 +314,79 @@ class EnhancedSoundGeneratorGUI(QMainWindow):
             self.start_btn.setText("Start")
 
     def audio_callback(self, in_data, frame_count, time_info, status):
-        output_buffer = np.zeros(frame_count)
-        for track in self.tracks:
-            output_buffer += track.generate_audio(frame_count)
-        return (output_buffer.astype(np.float32), pyaudio.paContinue)
+        # Snapshot the track list once: the GUI thread may add or remove
+        # tracks mid-callback, and reading self.tracks repeatedly could see
+        # different lists at different points in the block
+        tracks = self.tracks
+
+        if not tracks and frame_count <= len(self.silence):
+            # No generators attached: hand back the preallocated silence
+            # block instead of zeroing a fresh array every callback
+            return (self.silence[:frame_count], pyaudio.paContinue)
+
+        if len(tracks) == 1:
+            # Single source: pass its block straight through with at most
+            # one dtype cast instead of zeroing and accumulating a buffer
+            audio = tracks[0].generate_audio(frame_count)
+            return (np.asarray(audio, dtype=np.float32), pyaudio.paContinue)
+
+        # Accumulate in float32 directly; the stream is paFloat32, so this
+        # fuses the final astype cast into the mix instead of mixing in
+        # float64 and converting a copy at the end. Reuse the persistent
+        # buffer unless PortAudio asks for an unexpected block size.
+        if frame_count == len(self.mix_buffer):
+            output_buffer = self.mix_buffer
+        else:
+            output_buffer = np.empty(frame_count, dtype=np.float32)
+        mixed_any = False
+        for track in tracks:
+            if track.amplitude <= 0:
+                # Silent track: skip generation and its effects entirely
+                continue
+            block = track.generate_audio(frame_count)
+            if mixed_any:
+                # Explicit out= accumulate; casting handles any effect
+                # that still hands back a float64 block
+                np.add(output_buffer, block, out=output_buffer,
+                       casting='unsafe')
+            else:
+                # First audible track: copy instead of zero-then-add, so
+                # the buffer is only traversed once per contributing track
+                np.copyto(output_buffer, block, casting='unsafe')
+                mixed_any = True
+        if not mixed_any:
+            output_buffer.fill(0)
+        return (output_buffer, pyaudio.paContinue)
 
     def update_plot(self):
-        self.plot_widget.clear()
+        tracks = self.tracks
+
+        if not self.isVisible() or (not tracks and not self.waveform_plots):
+            # Nothing to draw (or nobody to see it): skip the tick
+            return
+
+        # Retire plot items for tracks that no longer exist
+        for track in list(self.waveform_plots):
+            if track not in tracks:
+                self.plot_item.removeItem(self.waveform_plots.pop(track))
+
         t = np.arange(self.frames_per_buffer) / self.sample_rate
-        for track in self.tracks:
-            audio_data = track.generate_audio(self.frames_per_buffer)
-            self.plot_widget.plot(t, audio_data, pen=pg.mkPen(track.color))
+        streaming = self.stream is not None
+        for track in tracks:
+            if streaming:
+                # Show what the audio callback actually produced; generating
+                # again here would advance oscillator phase from the GUI
+                # thread and double the synthesis work
+                audio_data = track.last_block
+            else:
+                audio_data = track.generate_audio(self.frames_per_buffer)
+            if audio_data is None or len(audio_data) != len(t):
+                continue
+            plot = self.waveform_plots.get(track)
+            if plot is None:
+                plot = self.plot_item.plot(pen=pg.mkPen(track.color))
+                self.waveform_plots[track] = plot
+            plot.setData(t, audio_data)
 
 
     def closeEvent(self, event):
@@ -274,6 +404,32 @@ class Track:
         self.amplitude = 0.5
         self.color = None
         self.effects = []
+        self.scratch = None
+        self.last_block = None  # Most recent generated block, for the display
+        self.time_base = None
+        # Hoisted per-sample-rate constants: multiply by the reciprocal
+        # instead of dividing each block, and keep 2*pi as float32 so the
+        # phase math stays single precision
+        self.inv_sample_rate = np.float32(1.0 / sample_rate)
+        self.two_pi = np.float32(2 * np.pi)
+
+    def get_time_base(self, num_frames):
+        # Cached arange(num_frames); rebuilt only when the block size
+        # changes, so generators stop allocating it every callback. Kept
+        # float64 because sample counters grow without bound.
+        if self.time_base is None or len(self.time_base) != num_frames:
+            self.time_base = np.arange(num_frames, dtype=np.float64)
+        return self.time_base
+
+    def get_scratch(self, num_frames, zero=True):
+        # Reusable per-track accumulation buffer; reallocated only when the
+        # block size changes. Pass zero=False when the caller overwrites
+        # the whole buffer anyway.
+        if self.scratch is None or len(self.scratch) != num_frames:
+            self.scratch = np.zeros(num_frames, dtype=np.float32)
+        elif zero:
+            self.scratch.fill(0)
+        return self.scratch
 
     def set_amplitude(self, amplitude):
         self.amplitude = max(0, min(1, amplitude))  # Clamp between 0 and 1
@@ -289,7 +445,10 @@ class Track:
 
     def apply_effects(self, audio):
         for effect in self.effects:
-            audio = effect(audio)
+            # Check is_active here and call process directly, skipping the
+            # __call__ wrapper per effect per block
+            if effect.is_active:
+                audio = effect.process(audio)
         return audio
 
     def generate_audio(self, num_frames):
@@ -298,32 +457,49 @@ class Track:
 class WaveTrack(Track):
     def __init__(self, sample_rate):
         super().__init__(sample_rate)
+        self.phase = 0  # Fixed-point table position; see PHASE_FRAC_BITS
         self.frequency = 440
-        self.wave_type = 'sine'
-        self.phase = 0
+        self.set_wave_type('sine')
+        self.set_frequency(440)
 
     def set_frequency(self, frequency):
         self.frequency = max(20, min(20000, frequency))  # Clamp between 20Hz and 20kHz
+        # Specialize the per-block step here, where the frequency changes,
+        # so generate_audio never redoes the float-to-fixed conversion
+        self.step = int(self.frequency * WAVETABLE_SIZE / self.sample_rate
+                        * (1 << PHASE_FRAC_BITS))
+        self.select_table()
 
     def set_wave_type(self, wave_type):
         if wave_type in ['sine', 'square', 'sawtooth', 'triangle']:
             self.wave_type = wave_type
+            # Dispatch resolved here, where the type changes; the block
+            # path reads the bound table with no lookup or branch
+            self.tables = WAVETABLE_STACKS[wave_type]
+            self.select_table()
+
+    def select_table(self):
+        # Pick the octave band whose harmonic budget matches the current
+        # pitch; higher notes get progressively duller (bandlimited)
+        # tables instead of aliasing
+        band = int(np.log2(self.frequency / WAVETABLE_MIN_FREQ))
+        self.table = self.tables[min(max(band, 0), len(self.tables) - 1)]
 
     def generate_audio(self, num_frames):
-        t = (np.arange(num_frames) + self.phase) / self.sample_rate
-        if self.wave_type == 'sine':
-            audio = np.sin(2 * np.pi * self.frequency * t)
-        elif self.wave_type == 'square':
-            audio = signal.square(2 * np.pi * self.frequency * t)
-        elif self.wave_type == 'sawtooth':
-            audio = signal.sawtooth(2 * np.pi * self.frequency * t)
-        elif self.wave_type == 'triangle':
-            audio = signal.sawtooth(2 * np.pi * self.frequency * t, width=0.5)
-        else:
-            audio = np.zeros(num_frames)
-        self.phase += num_frames
+        # Integer phase accumulator: per-sample positions are one
+        # multiply-add in uint64 (wrapping naturally on overflow), and
+        # the waveform is one masked gather from the table. Frequency
+        # changes only alter the step, so they stay phase-continuous.
+        phases = np.uint64(self.phase) + \
+            np.uint64(self.step) * np.arange(num_frames, dtype=np.uint64)
+        indices = (phases >> np.uint64(PHASE_FRAC_BITS)).astype(np.intp) \
+            & (WAVETABLE_SIZE - 1)
+        audio = self.table[indices]
+        self.phase = (self.phase + self.step * num_frames) & 0xFFFFFFFFFFFFFFFF
         audio = self.apply_effects(audio)
-        return audio * self.amplitude
+        audio *= self.amplitude  # In-place: the block is never shared at this point
+        self.last_block = audio
+        return audio
 
 class NoiseTrack(Track):
     def __init__(self, sample_rate):
@@ -336,23 +512,31 @@ class NoiseTrack(Track):
 
     def generate_audio(self, num_frames):
         if self.noise_type == 'white':
-            audio = np.random.normal(0, 1, num_frames)
+            audio = self.white_noise(num_frames)
         elif self.noise_type == 'pink':
             audio = self.pink_noise(num_frames)
         elif self.noise_type == 'brown':
             audio = self.brown_noise(num_frames)
         else:
-            audio = np.zeros(num_frames)
+            audio = np.zeros(num_frames, dtype=np.float32)
         audio = self.apply_effects(audio)
-        return audio * self.amplitude
+        audio *= self.amplitude  # In-place: the block is never shared at this point
+        self.last_block = audio
+        return audio
+
+    def white_noise(self, num_frames):
+        return np.random.normal(0, 1, num_frames).astype(np.float32)
 
     def pink_noise(self, num_frames):
-        white = np.random.normal(0, 1, num_frames)
-        return signal.lfilter([1.0], [1, -0.9], white)
+        # Float32 coefficients keep lfilter in single precision end to end
+        return signal.lfilter(np.ones(1, dtype=np.float32),
+                              np.array([1, -0.9], dtype=np.float32),
+                              self.white_noise(num_frames))
 
     def brown_noise(self, num_frames):
-        white = np.random.normal(0, 1, num_frames)
-        return signal.lfilter([1.0], [1, -0.98], white)
+        return signal.lfilter(np.ones(1, dtype=np.float32),
+                              np.array([1, -0.98], dtype=np.float32),
+                              self.white_noise(num_frames))
 
 class FMSynthTrack(Track):
     def __init__(self, sample_rate):
@@ -360,7 +544,11 @@ class FMSynthTrack(Track):
         self.carrier_freq = 440
         self.mod_freq = 220
         self.mod_index = 2
-        self.phase = 0
+        # Radian phases wrapped mod 2*pi per block (like the effect LFOs),
+        # so the sin arguments stay small enough for float32 no matter how
+        # long the stream has been running
+        self.carrier_phase = 0.0
+        self.mod_phase = 0.0
 
     def set_carrier_frequency(self, freq):
         self.carrier_freq = max(20, min(20000, freq))
@@ -372,12 +560,35 @@ class FMSynthTrack(Track):
         self.mod_index = max(0, min(10, index))
 
     def generate_audio(self, num_frames):
-        t = (np.arange(num_frames) + self.phase) / self.sample_rate
-        modulation = np.sin(2 * np.pi * self.mod_freq * t)
-        audio = np.sin(2 * np.pi * self.carrier_freq * t + self.mod_index * modulation)
-        self.phase += num_frames
+        # Block-relative time: always starts at zero, so float32 keeps
+        # full sample resolution; continuity across blocks comes from the
+        # wrapped radian phases, not from an absolute time vector
+        t = (self.get_time_base(num_frames)
+             * self.inv_sample_rate).astype(np.float32)
+        # Build the modulator and then the carrier in place in the scratch
+        # block; t is the only fresh allocation (the float64 -> float32
+        # conversion), everything else writes through out=
+        audio = self.get_scratch(num_frames, zero=False)
+        np.multiply(t, self.two_pi * np.float32(self.mod_freq), out=audio)
+        audio += np.float32(self.mod_phase)
+        np.sin(audio, out=audio)
+        np.multiply(audio, np.float32(self.mod_index), out=audio)
+        np.multiply(t, self.two_pi * np.float32(self.carrier_freq), out=t)
+        t += np.float32(self.carrier_phase)
+        np.add(audio, t, out=audio)
+        np.sin(audio, out=audio)
+        block_time = num_frames / self.sample_rate
+        self.mod_phase = (self.mod_phase
+                          + 2 * np.pi * self.mod_freq * block_time) % (2 * np.pi)
+        self.carrier_phase = (self.carrier_phase
+                              + 2 * np.pi * self.carrier_freq * block_time) % (2 * np.pi)
         audio = self.apply_effects(audio)
-        return audio * self.amplitude
+        audio *= self.amplitude  # In-place: the block is never shared at this point
+        # With no effects the block is still the reused scratch buffer,
+        # which the next callback rewrites in place while the GUI may be
+        # reading last_block — publish a stable copy in that case
+        self.last_block = audio.copy() if audio is self.scratch else audio
+        return audio
 
 class ContinuousNoteTrack(Track):
     def __init__(self, note, octave, sample_rate=44100):
@@ -395,12 +606,19 @@ class ContinuousNoteTrack(Track):
         self.harmonics = harmonics
 
     def generate_audio(self, num_frames):
-        t = np.arange(num_frames) / self.sample_rate
-        audio = np.zeros(num_frames)
-        for i, amplitude in enumerate(self.harmonics):
-            audio += amplitude * np.sin(2 * np.pi * self.frequency * (i + 1) * t)
+        t = (self.get_time_base(num_frames)
+             * self.inv_sample_rate).astype(np.float32)
+        # Evaluate every harmonic in one batched sin call over a
+        # (num_harmonics, num_frames) phase matrix, then reduce with a
+        # weighted sum — no Python-level loop per harmonic
+        amplitudes = np.asarray(self.harmonics, dtype=np.float32)
+        omegas = np.arange(1, len(amplitudes) + 1, dtype=np.float32) * \
+            (self.two_pi * np.float32(self.frequency))
+        audio = amplitudes @ np.sin(np.outer(omegas, t))
         audio = self.apply_effects(audio)
-        return audio * self.amplitude
+        audio *= self.amplitude  # In-place: the block is never shared at this point
+        self.last_block = audio
+        return audio
 
 
 class TrackControls(QGroupBox):
@@ -574,7 +792,6 @@ class TrackControls(QGroupBox):
         effect = self.track.get_effect(effect_name)
         if effect:
             setattr(effect, param_name, float(value))
-            print(f"Updated {effect_name} {param_name} to {value}")  # Debugging line
 
 
 class ContinuousNoteTrackControls(TrackControls):
@@ -631,26 +848,71 @@ class Effect:
 class ReverbEffect(Effect):
     def __init__(self, room_size=0.5, damping=0.5):
         super().__init__("Reverb")
-        self.room_size = float(room_size)
-        self.damping = float(damping)
-        self.buffer = np.zeros(44100)  # 1 second buffer at 44.1kHz
+        self._room_size = float(room_size)
+        self._damping = float(damping)
+        self.max_len = 44100  # Longest tail: 1 second at 44.1kHz
+        self.buffer = np.zeros(self.max_len, dtype=np.float32)
+        self.update_kernel()
+
+    # Parameter writes (including setattr from the effect sliders) rebuild
+    # the cached decay kernel; nothing recomputes it per block
+    @property
+    def room_size(self):
+        return self._room_size
+
+    @room_size.setter
+    def room_size(self, value):
+        self._room_size = float(value)
+        self.update_kernel()
+
+    @property
+    def damping(self):
+        return self._damping
+
+    @damping.setter
+    def damping(self, value):
+        self._damping = float(value)
+        self.update_kernel()
+
+    def update_kernel(self):
+        # Decay envelope over the whole buffer; constant until room_size or
+        # damping changes, so it is never rebuilt inside the sample loop
+        self.kernel = (self.room_size
+                       * np.exp(-np.arange(self.max_len) * self.damping / 44100)
+                       ).astype(np.float32)
 
     def process(self, audio):
-        output = np.zeros_like(audio)
-        for i, sample in enumerate(audio):
-            self.buffer = np.roll(self.buffer, -1)
-            self.buffer[-1] = sample
-            reverb = np.sum(self.buffer * self.room_size * np.exp(-np.arange(len(self.buffer)) * self.damping / 44100))
-            output[i] = sample + reverb
-        return output
+        n = len(audio)
+        history_len = len(self.buffer)
+        history = np.concatenate((self.buffer, audio))
+        # One FFT convolution with the time-reversed envelope per block
+        # replaces a 44100-tap dot product (and a full buffer roll) per
+        # sample
+        tail = signal.fftconvolve(history, self.kernel[::-1])
+        reverb = tail[history_len:history_len + n]
+        self.buffer = history[-history_len:].copy()
+        return audio + reverb
 
 class DistortionEffect(Effect):
     def __init__(self, amount=0.5):
         super().__init__("Distortion")
         self.amount = float(amount)
 
+    # Parameter writes (including setattr from the effect sliders) rebuild
+    # the cached normalization gain; a float64 np.tanh scalar in process
+    # would promote the whole block back to double
+    @property
+    def amount(self):
+        return self._amount
+
+    @amount.setter
+    def amount(self, value):
+        self._amount = float(value)
+        self._inv_gain = np.float32(1 / np.tanh(self._amount)) \
+            if self._amount else np.float32(1.0)
+
     def process(self, audio):
-        return np.tanh(audio * self.amount) / np.tanh(self.amount)
+        return np.tanh(audio * np.float32(self._amount)) * self._inv_gain
 
 class EQEffect(Effect):
     def __init__(self, low_gain=1.0, high_gain=1.0):
@@ -660,13 +922,21 @@ class EQEffect(Effect):
         self.update_filters()
 
     def update_filters(self):
-        self.low_b, self.low_a = signal.butter(1, 500 / (44100 / 2), btype='lowpass')
-        self.high_b, self.high_a = signal.butter(1, 2000 / (44100 / 2), btype='highpass')
+        # float32 coefficients keep lfilter (and its output) in single
+        # precision, matching the track pipeline
+        self.low_b, self.low_a = (c.astype(np.float32) for c in
+                                  signal.butter(1, 500 / (44100 / 2), btype='lowpass'))
+        self.high_b, self.high_a = (c.astype(np.float32) for c in
+                                    signal.butter(1, 2000 / (44100 / 2), btype='highpass'))
+        # Filter state carried across blocks so each callback continues the
+        # previous one instead of restarting the filter from rest
+        self.low_zi = np.zeros(len(self.low_a) - 1, dtype=np.float32)
+        self.high_zi = np.zeros(len(self.high_a) - 1, dtype=np.float32)
 
     def process(self, audio):
-        low = signal.lfilter(self.low_b, self.low_a, audio) * self.low_gain
-        high = signal.lfilter(self.high_b, self.high_a, audio) * self.high_gain
-        return low + high + audio * (1 - self.low_gain - self.high_gain)
+        low, self.low_zi = signal.lfilter(self.low_b, self.low_a, audio, zi=self.low_zi)
+        high, self.high_zi = signal.lfilter(self.high_b, self.high_a, audio, zi=self.high_zi)
+        return low * self.low_gain + high * self.high_gain + audio * (1 - self.low_gain - self.high_gain)
 
 class VibratoEffect(Effect):
     def __init__(self, rate=5, depth=0.005):
@@ -676,11 +946,12 @@ class VibratoEffect(Effect):
         self.phase = 0
 
     def process(self, audio):
-        t = np.arange(len(audio)) / 44100
-        vibrato = np.sin(2 * np.pi * self.rate * t + self.phase)
+        t = np.arange(len(audio), dtype=np.float32) / np.float32(44100)
+        vibrato = np.sin(np.float32(2 * np.pi * self.rate) * t + np.float32(self.phase))
         self.phase += 2 * np.pi * self.rate * len(audio) / 44100
         self.phase %= 2 * np.pi
-        return np.interp(t + self.depth * vibrato, t, audio)
+        # np.interp computes in double; cast back so the chain stays float32
+        return np.interp(t + np.float32(self.depth) * vibrato, t, audio).astype(np.float32)
 
 class TremoloEffect(Effect):
     def __init__(self, rate=5, depth=0.5):
@@ -690,8 +961,9 @@ class TremoloEffect(Effect):
         self.phase = 0
 
     def process(self, audio):
-        t = np.arange(len(audio)) / 44100
-        tremolo = 1 - self.depth * (0.5 + 0.5 * np.sin(2 * np.pi * self.rate * t + self.phase))
+        t = np.arange(len(audio), dtype=np.float32) / np.float32(44100)
+        tremolo = 1 - self.depth * (0.5 + 0.5 * np.sin(np.float32(2 * np.pi * self.rate) * t
+                                                       + np.float32(self.phase)))
         self.phase += 2 * np.pi * self.rate * len(audio) / 44100
         self.phase %= 2 * np.pi
         return audio * tremolo
@@ -702,38 +974,74 @@ class ChorusEffect(Effect):
         self.rate = float(rate)
         self.depth = float(depth)
         self.mix = float(mix)
-        self.buffer = np.zeros(int(44100 * 0.05))  # 50ms buffer
+        self.history_len = int(44100 * 0.05)  # 50ms of history
+        # Power-of-two ring (history plus block headroom) so wrapped reads
+        # are an & mask rather than a modulo, and blocks never need a
+        # concatenated copy of the delay line
+        ring_size = 1
+        while ring_size < self.history_len + 8192:
+            ring_size *= 2
+        self.ring = np.zeros(ring_size, dtype=np.float32)
+        self.ring_mask = ring_size - 1
+        self.write_pos = 0
         self.phase = 0
 
     def process(self, audio):
-        output = np.zeros_like(audio)
-        for i, sample in enumerate(audio):
-            self.buffer = np.roll(self.buffer, -1)
-            self.buffer[-1] = sample
-
-            lfo = np.sin(2 * np.pi * self.rate * i / 44100 + self.phase)
-            delay = int(self.depth * 44100 * (1 + lfo))
-
-            if delay < len(self.buffer):
-                output[i] = self.mix * self.buffer[-delay] + (1 - self.mix) * sample
-            else:
-                output[i] = sample
-
-        self.phase += 2 * np.pi * self.rate * len(audio) / 44100
+        n = len(audio)
+
+        # Whole-block LFO and per-sample delays (at least one sample)
+        t = np.arange(n)
+        lfo = np.sin(2 * np.pi * self.rate * t / 44100 + self.phase)
+        delays = np.maximum((self.depth * 44100 * (1 + lfo)).astype(np.intp), 1)
+
+        # Write the block into the ring as at most two contiguous slices
+        start = self.write_pos
+        end = start + n
+        if end <= len(self.ring):
+            self.ring[start:end] = audio
+        else:
+            split = len(self.ring) - start
+            self.ring[start:] = audio[:split]
+            self.ring[:end & self.ring_mask] = audio[split:]
+
+        # Delayed reads are a single masked gather out of the ring
+        read_idx = (start + t - (delays - 1)) & self.ring_mask
+        delayed = self.ring[read_idx]
+        valid = delays < self.history_len
+        output = np.where(valid, self.mix * delayed + (1 - self.mix) * audio, audio)
+
+        self.write_pos = end & self.ring_mask
+        self.phase += 2 * np.pi * self.rate * n / 44100
         self.phase %= 2 * np.pi
         return output
 
 class LowPassFilter(Effect):
     def __init__(self, cutoff=1000):
         super().__init__("LowPass")
-        self.cutoff = float(cutoff)
+        self._cutoff = float(cutoff)
+        self.update_filter()
+
+    # Parameter writes (including setattr from the effect sliders) rebuild
+    # the cached sections, mirroring ReverbEffect's kernel properties
+    @property
+    def cutoff(self):
+        return self._cutoff
+
+    @cutoff.setter
+    def cutoff(self, value):
+        self._cutoff = float(value)
         self.update_filter()
 
     def update_filter(self):
-        self.b, self.a = signal.butter(1, self.cutoff / (44100 / 2), btype='low', analog=False)
+        # Second-order sections: same C-loop speed as lfilter but
+        # numerically stable at low cutoffs
+        self.sos = signal.butter(1, self._cutoff / (44100 / 2),
+                                 btype='low', output='sos').astype(np.float32)
+        self.zi = np.zeros((self.sos.shape[0], 2), dtype=np.float32)
 
     def process(self, audio):
-        return signal.lfilter(self.b, self.a, audio)
+        audio, self.zi = signal.sosfilt(self.sos, audio, zi=self.zi)
+        return audio
 
 
 if __name__ == '__main__':